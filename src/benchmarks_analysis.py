@@ -12,18 +12,75 @@ SPDX-License-Identifier: BUSL-1.1
 """
 
 import datetime
+import io
 import os
 
 import json
-import warnings
+import re
+from functools import cached_property
 from pathlib import Path
 from typing import List
 
+import matplotlib
 import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
 from pandas.core.interchange.dataframe_protocol import DataFrame
-from scipy.signal import savgol_filter
+from scipy.ndimage import convolve1d
+from scipy.signal import savgol_coeffs
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+matplotlib.use("Agg")
+
+BENCHMARK_FILE_RE = re.compile(r"^(?P<test_number>\d+)_[^_]+_(?P<stamp>[^_]+)_.*\.json$")
+SIZE_RE = re.compile(r"_(\d+)\.json$")
+
+PNG_SAVE_KWARGS = {"optimize": False, "compress_level": 1}
+
+SAVGOL_WINDOW = 5
+SAVGOL_POLYORDER = 2
+SAVGOL_HALF = SAVGOL_WINDOW // 2
+SAVGOL_COEFFS = savgol_coeffs(window_length=SAVGOL_WINDOW, polyorder=SAVGOL_POLYORDER)
+SAVGOL_HEAD_COEFFS = np.array(
+    [savgol_coeffs(SAVGOL_WINDOW, SAVGOL_POLYORDER, pos=pos, use="dot") for pos in range(SAVGOL_HALF)]
+)
+SAVGOL_TAIL_COEFFS = np.array(
+    [
+        savgol_coeffs(SAVGOL_WINDOW, SAVGOL_POLYORDER, pos=pos, use="dot")
+        for pos in range(SAVGOL_HALF + 1, SAVGOL_WINDOW)
+    ]
+)
+
+BENCHMARK_COLUMNS = {
+    "params_func_name": "func",
+    "stats_min": "min",
+    "stats_max": "max",
+    "stats_mean": "mean",
+    "stats_stddev": "stddev",
+    "stats_ops": "ops",
+}
+
+MARKDOWN_COLUMNS = {
+    "size": "Elements",
+    "func": "Function",
+    "ops": "OPS",
+    "min": "Min Time (s)",
+    "max": "Max Time (s)",
+    "mean": "Mean Time (s)",
+    "stddev": "Std Dev",
+}
+
+MARKDOWN_FORMATS = {
+    "Min Time (s)": "%.2e",
+    "Max Time (s)": "%.2e",
+    "Mean Time (s)": "%.2e",
+    "Std Dev": "%.2e",
+    "OPS": "%.2f",
+}
 
 
 class BenchmarksAnalysis:
@@ -74,8 +131,35 @@ class BenchmarksAnalysis:
         Extract the `size` value from the given file path.
         Assumes the size is encoded as the last part before the file extension.
         """
-        split_filepath = filepath.split("_")
-        return int(split_filepath[-1].split(".")[0])
+        return int(SIZE_RE.search(filepath).group(1))
+
+    @staticmethod
+    def savgol_smooth(values: np.ndarray) -> np.ndarray:
+        """
+        Smooth `values` exactly like `savgol_filter(values, SAVGOL_WINDOW, SAVGOL_POLYORDER)`.
+        The interior is a convolution with the precomputed `SAVGOL_COEFFS`; the edge points keep the
+        default 'interp' semantics through the precomputed `SAVGOL_HEAD_COEFFS`/`SAVGOL_TAIL_COEFFS`
+        applied to the first and last windows. Shorter inputs are returned unchanged.
+        """
+        if len(values) < SAVGOL_WINDOW:
+            return values
+
+        smooth = convolve1d(values, SAVGOL_COEFFS)
+        smooth[:SAVGOL_HALF] = SAVGOL_HEAD_COEFFS @ values[:SAVGOL_WINDOW]
+        smooth[-SAVGOL_HALF:] = SAVGOL_TAIL_COEFFS @ values[-SAVGOL_WINDOW:]
+        return smooth
+
+    @staticmethod
+    def load_json_file(filepath: str) -> dict:
+        """
+        Decode a benchmark JSON file.
+        Uses `orjson` on the raw file bytes when it is installed and falls back to the stdlib `json`.
+        """
+        if orjson is not None:
+            return orjson.loads(Path(filepath).read_bytes())
+
+        with open(filepath, "r") as f:
+            return json.load(f)
 
     def run(self) -> None:
         """
@@ -97,10 +181,10 @@ class BenchmarksAnalysis:
     def load_benchmarks_files(self) -> List[str]:
         """
         Loads benchmark files matching a specific test number from a designated directory.
-        The function identifies files in the benchmarks directory that match a given test number,
-        extracts a unique timestamp from the matching files, and retrieves all files that share
-        the same timestamp. This ensures that all related benchmark files for a specific test are
-        collected efficiently.
+        The function scans the benchmarks directory once, matching every file name against
+        `BENCHMARK_FILE_RE` to get its test number and timestamp, picks the timestamp of the
+        given test number, and retrieves all files that share the same timestamp. This ensures
+        that all related benchmark files for a specific test are collected efficiently.
 
         :param test_number: An integer representing the test number used to filter and locate
             benchmark files. The test number will be zero-padded to ensure a four-digit format.
@@ -113,24 +197,65 @@ class BenchmarksAnalysis:
         benchmarks_dir = f".benchmarks/{self._platform}"
         search_pattern = str(self._test_number).zfill(4)
 
-        matched_files = [f for f in os.listdir(benchmarks_dir) if f.startswith(search_pattern) and f.endswith(".json")]
+        with os.scandir(benchmarks_dir) as entries:
+            matched_files = [
+                (entry.path, match)
+                for entry in entries
+                if entry.is_file() and (match := BENCHMARK_FILE_RE.match(entry.name))
+            ]
+
+        file_stamp = next(
+            (match["stamp"] for _, match in matched_files if int(match["test_number"]) == self._test_number),
+            None,
+        )
 
-        if not matched_files:
+        if file_stamp is None:
             raise FileNotFoundError(f"No benchmark files found starting with {search_pattern} in {benchmarks_dir}")
 
-        file_stamp = matched_files[0].split("_")[2]
-        return [
-            os.path.join(benchmarks_dir, f)
-            for f in os.listdir(benchmarks_dir)
-            if f.split("_")[2] == file_stamp and f.endswith(".json")
-        ]
+        return [filepath for filepath, match in matched_files if match["stamp"] == file_stamp]
+
+    @cached_property
+    def _files(self) -> List[str]:
+        """
+        Benchmark files of the analysed test, resolved once per instance.
+
+        :return: A list of file paths as returned by `load_benchmarks_files`.
+        :rtype: List[str]
+        """
+        return self.load_benchmarks_files()
+
+    @cached_property
+    def _records(self) -> pd.DataFrame:
+        """
+        Canonical benchmark records parsed once from all benchmark files.
+
+        Each file is decoded a single time and its benchmark entries are flattened
+        with `pd.json_normalize`. All public data frame builders are views over
+        this frame, so no file is read or parsed more than once per instance.
+
+        :return: A DataFrame with the 'size', 'func', 'min', 'max', 'mean',
+            'stddev' and 'ops' columns.
+        :rtype: pd.DataFrame
+        """
+        frames = []
+
+        for filepath in self._files:
+            data = self.load_json_file(filepath)
+
+            df_file = pd.json_normalize(data["benchmarks"], sep="_")[list(BENCHMARK_COLUMNS)]
+            df_file = df_file.rename(columns=BENCHMARK_COLUMNS)
+            df_file.insert(0, "size", self.extract_size_from_filepath(filepath))
+            frames.append(df_file)
+
+        return pd.concat(frames, ignore_index=True)
 
     def benchmarks_data_frame(self) -> pd.DataFrame:
         """
         Generates a Pandas DataFrame containing benchmark data extracted
         from all related files. The method processes multiple files, loads
         their content, extracts benchmark statistics, and organizes them
-        into a structured tabular format.
+        into a structured tabular format. Files are parsed once per instance;
+        every call returns a fresh copy, so callers may modify it freely.
 
         :param self: The instance of the class containing this method.
 
@@ -140,31 +265,7 @@ class BenchmarksAnalysis:
             benchmark statistics and other metadata.
         :rtype: pd.DataFrame
         """
-        files = self.load_benchmarks_files()
-
-        records = []
-
-        for filepath in files:
-            with open(filepath, "r") as f:
-                data = json.load(f)
-
-            filepath_split = filepath.split("_")
-
-            for entry in data["benchmarks"]:
-                size = self.extract_size_from_filepath(filepath)
-                func = entry["params"]["func_name"]
-                stats = entry["stats"]
-                records.append({
-                    "size": size,
-                    "func": func,
-                    "min": stats["min"],
-                    "max": stats["max"],
-                    "mean": stats["mean"],
-                    "stddev": stats["stddev"],
-                    "ops": stats["ops"]
-                })
-
-        return pd.DataFrame(records)
+        return self._records.copy()
 
     def benchmarks_plot(self, df: DataFrame) -> None:
         """
@@ -177,7 +278,9 @@ class BenchmarksAnalysis:
         functions provided in the DataFrame. The x-axis is set to log scale for both
         plots. The y-axis is also set to log scale for all metrics except "stddev".
         The generated plots are saved as PNG files in a directory defined by
-        `self.benchmarks_plot_dir`.
+        `self.benchmarks_plot_dir`. Rendering uses the non-interactive Agg backend
+        and constrained layout instead of a separate `tight_layout` pass, and PNGs
+        are encoded with a fast zlib level (`PNG_SAVE_KWARGS`).
 
         :param df: A DataFrame containing benchmarking data. The DataFrame must have the
             following columns:
@@ -188,39 +291,35 @@ class BenchmarksAnalysis:
         """
         metrics = ["min", "max", "mean", "stddev", "ops"]
 
+        groups = {func_name: group.sort_values("size") for func_name, group in df.groupby("func", sort=False)}
+        groups_large = {func_name: group[group["size"] > 1e5] for func_name, group in groups.items()}
+
+        variants = [
+            ("full", "Full Range", "Input Size", groups),
+            ("large", "Large Inputs Only", "Input Size (>1e5)", groups_large),
+        ]
+        plot_paths = {
+            (metric, suffix): self._benchmarks_plot_dir / f"benchmark_{metric}_{suffix}.png"
+            for metric in metrics
+            for suffix, *_ in variants
+        }
+
         for metric in metrics:
-            plt.figure(figsize=(10, 6))
-            for func_name in df["func"].unique():
-                data_by_func = df[df["func"] == func_name].sort_values("size")
-                plt.plot(data_by_func["size"], data_by_func[metric], label=func_name, marker='o')
-            plt.title(f"{metric.upper()} vs Size (Full Range)")
-            plt.xlabel("Input Size")
-            plt.ylabel(metric)
-            plt.legend()
-            plt.grid(True)
-            plt.xscale("log")
-            if metric != "stddev":
-                plt.yscale("log")
-            plt.tight_layout()
-            plt.savefig(f"{self._benchmarks_plot_dir}/benchmark_{metric}_full.png")
-            plt.close()
-
-            plt.figure(figsize=(10, 6))
-            for func_name in df["func"].unique():
-                data_by_func = df[(df["func"] == func_name) & (df["size"] > 1e5)].sort_values("size")
-                if not data_by_func.empty:
-                    plt.plot(data_by_func["size"], data_by_func[metric], label=func_name, marker='o')
-            plt.title(f"{metric.upper()} vs Size (Large Inputs Only)")
-            plt.xlabel("Input Size (>1e5)")
-            plt.ylabel(metric)
-            plt.legend()
-            plt.grid(True)
-            plt.xscale("log")
-            if metric != "stddev":
-                plt.yscale("log")
-            plt.tight_layout()
-            plt.savefig(f"{self._benchmarks_plot_dir}/benchmark_{metric}_large.png")
-            plt.close()
+            for suffix, scope, xlabel, metric_groups in variants:
+                fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
+                for func_name, data_by_func in metric_groups.items():
+                    if not data_by_func.empty:
+                        ax.plot(data_by_func["size"], data_by_func[metric], label=func_name, marker='o')
+                ax.set_title(f"{metric.upper()} vs Size ({scope})")
+                ax.set_xlabel(xlabel)
+                ax.set_ylabel(metric)
+                ax.legend()
+                ax.grid(True)
+                ax.set_xscale("log")
+                if metric != "stddev":
+                    ax.set_yscale("log")
+                fig.savefig(plot_paths[metric, suffix], pil_kwargs=PNG_SAVE_KWARGS)
+                plt.close(fig)
 
     def acceleration_plot(self, df: pd.DataFrame) -> None:
         """
@@ -230,9 +329,11 @@ class BenchmarksAnalysis:
         gain or loss.
 
         This function is intended to visualize and compare performance metrics for computational
-        functions with respect to a "Purem" baseline. It ensures that shared input sizes
-        are used for comparison and applies smoothing (Savitzky-Golay filter) to the acceleration
-        curve for better interpretability.
+        functions with respect to a "Purem" baseline. The operations per second are pivoted into
+        a size-by-function table once and divided by the "Purem" column in a single vectorized
+        step, so compared values are always aligned on their shared input sizes. Smoothing
+        (Savitzky-Golay filter) is applied to each acceleration curve for better interpretability.
+        The filter kernels are precomputed once at import time (see `savgol_smooth`).
 
         :param df: A pandas DataFrame containing benchmarking results with the following
             columns:
@@ -243,39 +344,28 @@ class BenchmarksAnalysis:
 
         :return: None
         """
-        func_names = df["func"].unique()
+        func_names = pd.unique(df["func"].values)
+        purem_mask = np.fromiter(("Purem" in name for name in func_names), dtype=bool, count=len(func_names))
 
-        assert any("Purem" in name for name in func_names), "Purem is missed!"
+        assert purem_mask.any(), "Purem is missed!"
 
-        df_purem = df[df["func"].str.contains("Purem")].sort_values("size")
+        purem_name = func_names[purem_mask][0]
+        other_names = list(func_names[~purem_mask])
 
-        plt.figure(figsize=(14, 8))
+        pivot = df.pivot_table(index="size", columns="func", values="ops", aggfunc="mean").sort_index()
+        accelerations = pivot[other_names].div(pivot[purem_name], axis=0)
 
-        for func_name in func_names:
-            if "Purem" in func_name:
-                continue
+        plt.figure(figsize=(14, 8))
 
-            df_other = df[df["func"] == func_name].sort_values("size")
-            common_sizes = np.intersect1d(df_purem["size"], df_other["size"])
+        for func_name, acceleration in accelerations.items():
+            acceleration = acceleration.dropna()
 
-            if len(common_sizes) == 0:
+            if acceleration.empty:
                 continue
 
-            purem_ops = df_purem[df_purem["size"].isin(common_sizes)]["ops"].values
-            other_ops = df_other[df_other["size"].isin(common_sizes)]["ops"].values
-
-            acceleration = other_ops / purem_ops
-
-            try:
-                if len(acceleration) >= 5:
-                    acceleration_smooth = savgol_filter(acceleration, window_length=5, polyorder=2)
-                else:
-                    acceleration_smooth = acceleration
-            except Exception as e:
-                warnings.warn(f"Smoothing skipped: {e}")
-                acceleration_smooth = acceleration
+            acceleration_smooth = self.savgol_smooth(acceleration.to_numpy(dtype=float))
 
-            plt.plot(common_sizes, acceleration_smooth, marker='o', label=f"Purem vs {func_name.partition(':')[2].strip()}")
+            plt.plot(acceleration.index, acceleration_smooth, marker='o', label=f"Purem vs {func_name.partition(':')[2].strip()}")
 
         plt.xscale('log')
         plt.yscale('log')
@@ -286,19 +376,18 @@ class BenchmarksAnalysis:
         plt.grid(True, which="both", linestyle='--', linewidth=0.6)
         plt.legend(fontsize=12)
         plt.tight_layout()
-        plt.savefig(f"{self._benchmarks_plot_dir}/benchmark_acceleration_large.png")
+        plt.savefig(self._benchmarks_plot_dir / "benchmark_acceleration_large.png", pil_kwargs=PNG_SAVE_KWARGS)
         plt.close()
 
     def markdown_data_frame(self) -> pd.DataFrame:
         """
         Converts benchmark data from files into a structured pandas DataFrame.
 
-        This method processes a collection of JSON files that contain benchmark
-        results. It reads the files, extracts relevant statistical information
-        about the benchmarking process, and formats this data into a structured
-        pandas DataFrame. Each record in the resultant DataFrame represents a
-        specific benchmark test and includes its relevant metadata and statistical
-        metrics.
+        This method reuses the canonical benchmark records parsed from the JSON
+        files and renames its columns into a human-readable layout, so the
+        files are read and parsed only once per analysis. Each record in the
+        resultant DataFrame represents a specific benchmark test and includes
+        its relevant metadata and statistical metrics.
 
         :return:
             A pandas DataFrame where each row corresponds to a benchmark with
@@ -307,38 +396,15 @@ class BenchmarksAnalysis:
         :rtype:
             pd.DataFrame
         """
-        files = self.load_benchmarks_files()
-
-        records_markdown = []
-
-        for filepath in files:
-            with open(filepath, "r") as f:
-                data = json.load(f)
-
-            filepath_split = filepath.split("_")
-
-            for b in data['benchmarks']:
-                size = self.extract_size_from_filepath(filepath)
-                func_name = b['params']['func_name']
-                stats = b['stats']
-                records_markdown.append({
-                    "Elements": size,
-                    "Function": func_name,
-                    "OPS": stats["ops"],
-                    "Min Time (s)": stats["min"],
-                    "Max Time (s)": stats["max"],
-                    "Mean Time (s)": stats["mean"],
-                    "Std Dev": stats["stddev"]
-                })
-
-        return pd.DataFrame(records_markdown)
+        return self._records[list(MARKDOWN_COLUMNS)].rename(columns=MARKDOWN_COLUMNS)
 
     def markdown_save(self, df: pd.DataFrame) -> None:
         """
         Saves a markdown file summarizing benchmark results in a human-readable format. The function processes
         a pandas DataFrame containing benchmark data, formats specific columns for scientific notation or fixed-point
-        notation, and groups the results by the "Elements" column. Each group is written as a separate section
-        in the markdown file, where the file is saved to the benchmarks directory.
+        notation in a single vectorized pass, and groups the results by the "Elements" column. Each group is written
+        as a separate section in the markdown file. Sections are assembled in memory and the file is written
+        to the benchmarks directory in one go.
 
         :param df: A pandas DataFrame containing benchmark results. Expected columns include "Elements",
             "OPS", "Min Time (s)", "Max Time (s)", "Mean Time (s)", and "Std Dev".
@@ -346,17 +412,15 @@ class BenchmarksAnalysis:
         """
         df = df.sort_values(by=["Elements", "OPS"], ascending=[True, False])
 
-        df["Min Time (s)"] = df["Min Time (s)"].map(lambda x: f"{x:.2e}")
-        df["Max Time (s)"] = df["Max Time (s)"].map(lambda x: f"{x:.2e}")
-        df["Mean Time (s)"] = df["Mean Time (s)"].map(lambda x: f"{x:.2e}")
-        df["Std Dev"] = df["Std Dev"].map(lambda x: f"{x:.2e}")
-        df["OPS"] = df["OPS"].map(lambda x: f"{x:.2f}")
+        columns = list(MARKDOWN_FORMATS)
+        formatted = np.char.mod(list(MARKDOWN_FORMATS.values()), df[columns].to_numpy(dtype=float))
+        df = df.assign(**dict(zip(columns, formatted.T)))
 
-        grouped = df.groupby('Elements')
+        buffer = io.StringIO()
+        buffer.write("# Benchmark Results\n\n")
+        for size, group in df.groupby("Elements", sort=True):
+            buffer.write(f"### Elements: {size}\n\n")
+            group.drop(columns=["Elements"]).to_markdown(buffer, index=False)
+            buffer.write("\n\n")
 
-        with open(f"{self._benchmarks_plot_dir}/benchmarks_table.md", "w") as f:
-            f.write("# Benchmark Results\n\n")
-            for size, group in grouped:
-                f.write(f"### Elements: {size}\n\n")
-                f.write(group.drop(columns=["Elements"]).to_markdown(index=False))
-                f.write("\n\n")
+        (self._benchmarks_plot_dir / "benchmarks_table.md").write_text(buffer.getvalue())
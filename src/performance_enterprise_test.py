@@ -14,27 +14,27 @@ SPDX-License-Identifier: BUSL-1.1
 import gc
 import math
 import os
-import random
-from typing import List
+from typing import Iterator, List, Union
 
 import numpy as np
 import pytest
 import torch
-from numba import njit
+from numba import njit, prange
+from scipy.special import softmax as sp_softmax
 from purem import purem
 
-purem.configure(license_key=os.getenv("PUREM_LICENSE_KEY", None))
 ARRAY_SIZE = int(os.environ.get("ARRAY_SIZE", 200_000))
+NUMBA_CHUNK_SIZE = 4096
 
 
-def generate_numbers(size, start=0.0, end=1.0) -> List[float]:
+def generate_numbers(size, start=0.0, end=1.0, as_list=False, seed=None) -> Union[np.ndarray, List[float]]:
     """
-    Generates a list of random floating-point numbers within a specified range.
+    Generates random floating-point numbers within a specified range.
 
-    This function creates a list of random numbers based on the size specified by
-    the user. The numbers are uniformly distributed and fall within the range
-    defined by the `start` and `end` parameters. If `start` and `end` are not provided,
-    they default to 0.0 and 1.0, respectively.
+    This function fills a contiguous float64 numpy array with random numbers
+    based on the size specified by the user. The numbers are uniformly distributed
+    and fall within the range defined by the `start` and `end` parameters. If
+    `start` and `end` are not provided, they default to 0.0 and 1.0, respectively.
 
     :param size: The number of random numbers to generate.
     :type size: int
@@ -42,39 +42,85 @@ def generate_numbers(size, start=0.0, end=1.0) -> List[float]:
     :type start: float
     :param end: The upper bound of the range for the random numbers. Defaults to 1.0.
     :type end: float
-    :return: A list of random floating-point numbers within the specified range.
-    :rtype: list[float]
+    :param as_list: Return a plain Python list instead of a numpy array. Defaults to False.
+    :type as_list: bool
+    :param seed: Seed of the random generator, for reproducible inputs. Defaults to None.
+    :type seed: int or None
+    :return: Random floating-point numbers within the specified range.
+    :rtype: np.ndarray or list[float]
     """
-    return [random.uniform(start, end) for _ in range(size)]
+    numbers = np.random.default_rng(seed).uniform(start, end, size).astype(np.float64, copy=False)
+    return numbers.tolist() if as_list else numbers
 
 
-@pytest.fixture(autouse=True)
-def clean_memory() -> None:
+@pytest.fixture(scope="session", autouse=True)
+def gc_setup(session_warmup) -> Iterator[None]:
     """
-    A pytest fixture to clean up memory before each test.
+    A pytest fixture that takes the garbage collector out of the measurements.
 
-    This fixture is automatically used for every test function due to the
-    `autouse=True` parameter. It ensures that garbage collection is triggered,
-    helping maintain a clean state in memory between test executions.
+    Once the session is warmed up, the heap is collected a single time and all
+    surviving objects (PyTorch, Numba and Purem internals, compiled kernels)
+    are moved to the permanent generation with `gc.freeze()`. Automatic
+    collection is then disabled for the session, so cleanup between tests
+    relies on reference counting only. Keep passing `--benchmark-disable-gc`
+    to pytest, as the Makefile targets do, so that pytest-benchmark itself
+    also keeps collection off inside measured rounds.
 
-    :return: None
+    :yield: None
     """
     gc.collect()
+    gc.freeze()
+    gc.disable()
+    yield
+    gc.enable()
+    gc.unfreeze()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def array_instance() -> np.ndarray:
     """
     Creates and returns a numpy array fixture for testing.
 
     This fixture generates a numpy array based on the provided
     `generate_numbers` function and the defined `ARRAY_SIZE`.
-    The array elements are cast to the `float` data type.
+    The array elements are of the `float64` data type.
+    The array is seeded and built once per module, so every
+    implementation is benchmarked on exactly the same input.
 
     :yield: A numpy array of floating-point numbers for testing.
     :rtype: np.ndarray
     """
-    return np.array(generate_numbers(ARRAY_SIZE), dtype=float)
+    return generate_numbers(ARRAY_SIZE, seed=0)
+
+
+@pytest.fixture(scope="module")
+def array_instance_f32(array_instance) -> np.ndarray:
+    """
+    Creates and returns a float32 copy of the `array_instance` fixture.
+
+    Single precision halves the bytes moved per element, which matters for
+    memory-bound kernels such as the exponential in softmax.
+
+    :yield: A numpy array of `float32` numbers for testing.
+    :rtype: np.ndarray
+    """
+    return array_instance.astype(np.float32, copy=False)
+
+
+@pytest.fixture(scope="module")
+def tensor_instance(array_instance_f32) -> torch.Tensor:
+    """
+    Creates and returns a PyTorch tensor view of the `array_instance_f32` fixture.
+
+    The tensor shares memory with the numpy array (`torch.from_numpy`), so it
+    is built without a copy and the benchmark times only the softmax itself.
+    If MPS is re-enabled, pin the host tensor here so the transfer overlaps
+    with compute: `.pin_memory().to("mps", non_blocking=True)`.
+
+    :yield: A `float32` PyTorch tensor for testing.
+    :rtype: torch.Tensor
+    """
+    return torch.from_numpy(array_instance_f32)
 
 
 def softmax_purem(arr: np.ndarray) -> np.ndarray:
@@ -102,55 +148,72 @@ def softmax_numpy(arr: np.ndarray) -> np.ndarray:
 
     This function calculates the softmax of the input array. It stabilizes
     the computation by subtracting the maximum value from the array to
-    prevent numerical overflow in the exponential calculation.
+    prevent numerical overflow in the exponential calculation. All steps
+    run in place on a single output buffer, so no temporaries are allocated.
 
     :param arr: Input array for which softmax needs to be calculated.
     :type arr: np.ndarray
     :return: The computed softmax values as an array.
     :rtype: np.ndarray
     """
-    arr_max = np.max(arr)
-    shifted = arr - arr_max
-    arr_exp = np.exp(shifted)
-    return arr_exp / np.sum(arr_exp)
+    out = np.empty_like(arr)
+    np.subtract(arr, arr.max(), out=out)
+    np.exp(out, out=out)
+    out /= out.sum()
+    return out
 
 
-# device = "mps" if torch.backends.mps.is_available() else "cpu"
-device = "cpu"
+def softmax_scipy(arr: np.ndarray) -> np.ndarray:
+    """
+    Compute the softmax of a given array using SciPy.
 
+    This function delegates to `scipy.special.softmax` and serves as a second
+    reference baseline next to the plain NumPy implementation.
 
-def softmax_torch(arr: np.ndarray) -> torch.Tensor:
+    :param arr: Input array for which softmax needs to be calculated.
+    :type arr: np.ndarray
+    :return: The computed softmax values as an array.
+    :rtype: np.ndarray
     """
-    Applies the softmax function along the last dimension of the input array.
+    return sp_softmax(arr)
 
-    This function takes a NumPy array or similar Python data structure as input,
-    converts it to a PyTorch tensor, and computes the softmax values along the
-    last dimension. The input is cast to a float32 tensor for compatibility with
-    PyTorch computations. The result is returned as a PyTorch tensor.
 
-    :param arr: Input array to be converted to a PyTorch tensor and processed
-        using the softmax function. The array can be of any shape, with the
-        softmax computation applied along its last dimension.
-    :type arr: array-like
+def softmax_torch(tensor: torch.Tensor) -> torch.Tensor:
+    """
+    Applies the softmax function along the last dimension of the input tensor.
+
+    This function takes a PyTorch tensor prepared by the `tensor_instance`
+    fixture and computes the softmax values along the last dimension. No
+    conversion or device transfer happens per call. The result is returned as
+    a PyTorch tensor.
+
+    :param tensor: Input float32 tensor to be processed using the softmax
+        function. The tensor can be of any shape, with the softmax computation
+        applied along its last dimension.
+    :type tensor: torch.Tensor
     :return: A PyTorch tensor containing the softmax values computed from the
-        input array along its last dimension.
+        input tensor along its last dimension.
     :rtype: torch.Tensor
     """
-    array_torch = torch.asarray(arr, dtype=torch.float32, device=device)
-    arr_torch = array_torch.to(dtype=torch.float32)
-    return arr_torch.softmax(dim=-1)
+    return tensor.softmax(dim=-1)
 
 
-@njit(parallel=True, fastmath=True)
+@njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
 def softmax_numba(arr: np.ndarray) -> np.ndarray:
     """
     Computes the softmax function for a given array with NumPy and Numba for
     parallelized execution. The function calculates the exponential normalization
     of a NumPy array to transform input values into probabilities that sum to one.
 
-    The function optimizes the computation using the maximum value of the input
-    array to improve numerical stability, specifically by avoiding overflow
-    and underflow during exponentiation.
+    Every chunk of `NUMBA_CHUNK_SIZE` elements is processed by one thread in
+    a single fused pass: its local maximum is taken while the chunk is still
+    in cache, its shifted exponentials are written to the output and summed.
+    The chunk results are then merged, and a second pass only rescales each
+    chunk by `exp(chunk_max - max) / total`, so every element is
+    exponentiated exactly once. Exponentials run as `np.exp` on array slices,
+    which Numba lowers to the vectorized SVML exponential when `icc-rt` is
+    installed. Arithmetic stays in the input dtype, so `float32` input moves
+    half the bytes and fills twice the SIMD lanes.
 
     :param arr: Input array of floats
     :type arr: numpy.ndarray
@@ -159,98 +222,84 @@ def softmax_numba(arr: np.ndarray) -> np.ndarray:
     """
     n = arr.shape[0]
     out = np.empty_like(arr)
-    x_max = -np.inf
-    for i in range(n):
-        if arr[i] > x_max:
-            x_max = arr[i]
+    if n == 0:
+        return out
+
+    n_chunks = (n + NUMBA_CHUNK_SIZE - 1) // NUMBA_CHUNK_SIZE
+    chunk_max = np.empty(n_chunks, dtype=arr.dtype)
+    chunk_sum = np.empty(n_chunks)
+    for c in prange(n_chunks):
+        start = c * NUMBA_CHUNK_SIZE
+        stop = min(start + NUMBA_CHUNK_SIZE, n)
+        m = arr[start:stop].max()
+        out[start:stop] = np.exp(arr[start:stop] - m)
+        chunk_max[c] = m
+        chunk_sum[c] = out[start:stop].sum()
+
+    x_max = chunk_max.max()
     total = 0.0
-    for i in range(n):
-        out[i] = math.exp(arr[i] - x_max)
-        total += out[i]
-    for i in range(n):
-        out[i] /= total
-    return out
-
+    for c in range(n_chunks):
+        total += chunk_sum[c] * math.exp(chunk_max[c] - x_max)
 
-functions = {
-    'Softmax: Purem': softmax_purem,
-    'Softmax: NumPy': softmax_numpy,
-    'Softmax: PyTorch': softmax_torch,
-    'Softmax: Numba': softmax_numba,
-}
+    for c in prange(n_chunks):
+        start = c * NUMBA_CHUNK_SIZE
+        stop = min(start + NUMBA_CHUNK_SIZE, n)
+        out[start:stop] *= math.exp(chunk_max[c] - x_max) / total
+    return out
 
 
-@pytest.mark.parametrize("func_name", [pytest.param("Softmax: Purem")])
-def test_purem_softmax(benchmark, func_name, array_instance):
+@pytest.fixture(scope="session", autouse=True)
+def session_warmup() -> None:
     """
-    Tests the performance of the `softmax_purem` function using the Benchmark fixture.
+    A pytest fixture that prepares the benchmark session once.
+
+    It configures the Purem license and raises PyTorch's intra-op thread
+    count to the number of CPUs this process may run on (some builds default
+    to a single thread; the count is never lowered). It then calls
+    `softmax_numba` on tiny `float64` and `float32` arrays, which triggers JIT
+    compilation (or loads it from the on-disk cache) before any benchmark
+    runs. Neither setup nor compile time can leak into measured rounds this
+    way.
 
-    :param benchmark: Benchmark fixture provided by pytest-benchmark for measuring
-        the performance of the `softmax_purem` function.
-    :param func_name: Name of the function being tested in the benchmarking process.
-    :param array_instance: Input data instance provided to the `softmax_purem` function
-        during the benchmarking test.
     :return: None
     """
-    benchmark(softmax_purem, array_instance)
+    purem.configure(license_key=os.getenv("PUREM_LICENSE_KEY", None))
+    if hasattr(os, "sched_getaffinity"):
+        available_cpus = len(os.sched_getaffinity(0))
+    else:
+        available_cpus = os.cpu_count() or 1
+    if available_cpus > torch.get_num_threads():
+        torch.set_num_threads(available_cpus)
+    softmax_numba(np.zeros(8, dtype=np.float64))
+    softmax_numba(np.zeros(8, dtype=np.float32))
 
 
-@pytest.mark.parametrize("func_name", [pytest.param("Softmax: NumPy")])
-def test_numpy_softmax(benchmark, func_name, array_instance):
-    """
-    Benchmark test for the numpy implementation of the softmax function. This test
-    uses pytest parametrize to evaluate the performance of the function across
-    different sizes of input and under a specific function name label. It clears
-    garbage, generates random floating-point numbers of the specified size, and
-    then benchmarks the softmax function.
-
-    :param benchmark: The pytest-benchmark fixture used for executing the
-        performance test of the softmax function.
-    :param func_name: Determines the function name label for benchmarking.
-    :param size: The size of the input data array to be generated and used in
-        the softmax function.
-    :return: None
-    """
-    benchmark(softmax_numpy, array_instance)
+functions = {
+    'Softmax: Purem': (softmax_purem, "array_instance"),
+    'Softmax: NumPy': (softmax_numpy, "array_instance"),
+    'Softmax: NumPy (float32)': (softmax_numpy, "array_instance_f32"),
+    'Softmax: SciPy': (softmax_scipy, "array_instance"),
+    'Softmax: PyTorch': (softmax_torch, "tensor_instance"),
+    'Softmax: Numba': (softmax_numba, "array_instance"),
+    'Softmax: Numba (float32)': (softmax_numba, "array_instance_f32"),
+}
 
 
-@pytest.mark.parametrize("func_name", [pytest.param("Softmax: PyTorch")])
-def test_torch_softmax(benchmark, func_name, array_instance):
-    """
-    Tests the performance of the PyTorch implementation of the softmax function over
-    an array of a specified size using the pytest benchmarking framework.
-
-    This test generates a random array of numbers of the given size, applies the
-    softmax operation implemented in PyTorch, and records its performance metrics
-    using the pytest-benchmark plugin.
-
-    :param benchmark: A pytest-benchmark function used to measure the performance
-        of the specified function under test.
-    :param func_name: The name of the function being tested.
-    :param size: The size of the input array for which softmax computation is executed.
-    :rtype: None
-    :return: Returns None as this function is a test case invoked by pytest.
+@pytest.mark.parametrize("func_name", list(functions))
+def test_softmax(benchmark, request, func_name):
     """
-    benchmark(softmax_torch, array_instance)
+    Benchmarks every softmax implementation registered in `functions`.
 
+    Each entry maps the benchmark label to the implementation and the name of
+    the input fixture it consumes. The input fixtures are module-scoped, so
+    all implementations share the same arrays and the random input is
+    generated only once per module.
 
-@pytest.mark.parametrize("func_name", [pytest.param("Softmax: Numba")])
-def test_numba_softmax(benchmark, func_name, array_instance):
-    """
-    Tests the performance of the Numba-accelerated softmax function using pytest.
-
-    This test leverages the pytest benchmarking tool to measure the time taken
-    to compute the softmax operation on an array of specified size using the
-    Numba implementation. It uses parameterized inputs for varying
-    function names and sizes to validate the performance in different configurations.
-
-    :param benchmark: The pytest benchmarking fixture used to time the execution
-                      of the softmax function.
-    :param func_name: The name of the function being tested. This parameter is
-                      parameterized by the pytest decorator.
-    :param size: The size of the input array for which the softmax function is
-                 benchmarked. This parameter is also parameterized by the
-                 pytest decorator.
+    :param benchmark: The pytest-benchmark fixture used for executing the
+        performance test of the softmax function.
+    :param request: The pytest request object used to resolve the input fixture.
+    :param func_name: The label of the implementation being benchmarked.
     :return: None
     """
-    benchmark(softmax_numba, array_instance)
+    func, input_fixture = functions[func_name]
+    benchmark(func, request.getfixturevalue(input_fixture))